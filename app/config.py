@@ -2,31 +2,87 @@
 Configuration management for the application.
 Loads environment variables and provides centralized config access.
 """
-from pydantic_settings import BaseSettings
-from typing import Optional
+import os
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from dotenv import load_dotenv
 
 
-class Settings(BaseSettings):
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings loaded from environment variables."""
     
     # MongoDB Configuration
     MONGODB_URL: str = "mongodb://localhost:27017"  # Update this with MongoDB Atlas URL for production
     MASTER_DB_NAME: str = "master_organization_db"
     
+    # MongoDB Connection Pool
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 2000
+    MONGODB_MAX_POOL_SIZE: int = 200
+    MONGODB_MIN_POOL_SIZE: int = 10  # Kept warm; set to steady-state concurrency
+    MONGODB_MAX_CONNECTING: int = 2  # Concurrent connection handshakes per server
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = 2000  # Max wait for a free pooled connection
+    MONGODB_MAX_IDLE_TIME_MS: int = 300000
+    
     # JWT Configuration
-    SECRET_KEY: str = "your-secret-key-change-this-in-production"
+    SECRET_KEY: str = "your-secret-key-change-this-in-production"  # PEM private key for RS*/PS*/ES*/EdDSA
+    JWT_PUBLIC_KEY: str = ""  # PEM public key; required unless ALGORITHM is HS*
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Password Hashing (use 4 in local development/tests for fast logins)
+    BCRYPT_ROUNDS: int = 12
+    
     # Application Configuration
     APP_NAME: str = "Organization Management Service"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = True
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    def __post_init__(self):
+        if not self.ALGORITHM.startswith("HS") and not self.JWT_PUBLIC_KEY:
+            raise ValueError(
+                f"JWT_PUBLIC_KEY must be set to verify {self.ALGORITHM} tokens"
+            )
+    
+    @property
+    def JWT_VERIFY_KEY(self) -> str:
+        """Key that verifies issued tokens: the shared secret for HS*, else the public key."""
+        return self.SECRET_KEY if self.ALGORITHM.startswith("HS") else self.JWT_PUBLIC_KEY
+    
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        Build settings from environment variables, falling back to defaults.
+        
+        Values are converted to each field's declared type (str, int or bool).
+        
+        Returns:
+            Settings instance
+        """
+        values = {}
+        for setting in fields(cls):
+            raw = os.environ.get(setting.name)
+            if raw is None:
+                continue
+            if setting.type is bool:
+                values[setting.name] = raw.strip().lower() in _TRUE_VALUES
+            elif setting.type is int:
+                values[setting.name] = int(raw)
+            else:
+                values[setting.name] = raw
+        return cls(**values)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Dependency injection for settings; the environment is parsed only once."""
+    # Variables already set in the environment take precedence over .env
+    load_dotenv(".env")
+    return Settings.from_env()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
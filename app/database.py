@@ -2,36 +2,159 @@
 Database connection and management.
 Handles MongoDB connections for both master database and dynamic organization collections.
 """
+import asyncio
+import threading
+from cachetools import TTLCache
 from motor.motor_asyncio import AsyncIOMotorClient
-from typing import Optional
+from pymongo.errors import OperationFailure
+from pymongo.topology_description import TOPOLOGY_TYPE
+from typing import Dict, Optional
 from app.config import settings
 
 
+# Collections in the master database
+ORGANIZATIONS_COLLECTION = "organizations"
+ADMINS_COLLECTION = "admins"
+
+# How long a collection existence result is trusted; other workers may
+# create or drop collections behind this process's back
+COLLECTION_EXISTS_CACHE_TTL_SECONDS = 60
+
+# Documents per insert_many when copying a collection client-side
+COPY_BATCH_SIZE = 1000
+
+# Server error codes meaning the deployment cannot run $out for this copy:
+# IllegalOperation, CommandNotSupported, AtlasError (shared tiers), sharded
+# output collection (17017, 28769) and unrecognized pipeline stage
+OUT_UNSUPPORTED_CODES = frozenset({20, 115, 8000, 17017, 28769, 40324})
+
+
 class DatabaseManager:
     """Manages MongoDB connections and database operations."""
     
     def __init__(self):
-        self.client: Optional[AsyncIOMotorClient] = None
-        self.master_db = None
+        # Motor clients are bound to the event loop they first run on, so
+        # each loop (uvicorn worker, background loop, test loop) gets its own
+        self._clients: Dict[asyncio.AbstractEventLoop, AsyncIOMotorClient] = {}
+        self._clients_lock = threading.Lock()
+        # Multi-document transactions need a replica set or mongos;
+        # detected when connecting
+        self.supports_transactions = False
+        # Uniqueness of names and emails rests on these indexes; set once
+        # ensure_indexes() has succeeded
+        self.indexes_ready = False
+        self._collection_exists_cache = TTLCache(
+            maxsize=1024,
+            ttl=COLLECTION_EXISTS_CACHE_TTL_SECONDS
+        )
+    
+    @property
+    def client(self) -> Optional[AsyncIOMotorClient]:
+        """The client of the running event loop, if one has been created."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        return self._clients.get(loop)
+    
+    @property
+    def master_db(self):
+        """The master database on the running event loop's client."""
+        return self.get_client()[settings.MASTER_DB_NAME]
+    
+    def get_client(self) -> AsyncIOMotorClient:
+        """
+        Get the MongoDB client for the running event loop.
+        
+        The client is created on first use from each loop and reused
+        afterwards. Creating one also closes and forgets the clients of
+        loops that have since been closed, so their pools and monitor
+        threads do not live until shutdown.
+        
+        Returns:
+            Motor client bound to the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(loop)
+                if client is None:
+                    self._evict_closed_loops()
+                    client = AsyncIOMotorClient(
+                        settings.MONGODB_URL,
+                        serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+                        maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+                        minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+                        maxConnecting=settings.MONGODB_MAX_CONNECTING,
+                        waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+                        maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+                        tz_aware=True
+                    )
+                    self._clients[loop] = client
+        return client
+    
+    def _evict_closed_loops(self):
+        """Close the clients of closed event loops; caller holds the lock."""
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            self._clients.pop(loop).close()
     
     async def connect_to_database(self):
         """Establish connection to MongoDB."""
         try:
-            self.client = AsyncIOMotorClient(settings.MONGODB_URL, serverSelectionTimeoutMS=5000)
             # Test the connection
-            await self.client.admin.command('ping')
-            self.master_db = self.client[settings.MASTER_DB_NAME]
+            client = self.get_client()
+            await client.admin.command('ping')
+            self.supports_transactions = client.topology_description.topology_type in (
+                TOPOLOGY_TYPE.ReplicaSetWithPrimary,
+                TOPOLOGY_TYPE.Sharded
+            )
             print(f"Connected to MongoDB at {settings.MONGODB_URL}")
+            await self.ensure_indexes()
         except Exception as e:
             print(f"Failed to connect to MongoDB: {e}")
             print("Warning: Running without database connection")
     
     async def close_database_connection(self):
-        """Close MongoDB connection."""
-        if self.client:
-            self.client.close()
+        """Close all MongoDB connections."""
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+        if clients:
             print("Closed MongoDB connection")
     
+    async def ensure_indexes(self):
+        """
+        Create the unique indexes on the master collections.
+        
+        Organization names and admin emails are kept unique by MongoDB, so
+        inserts fail with DuplicateKeyError instead of needing a lookup first.
+        Every lookup key (name, email and both IDs, which also back the
+        $lookup joins) is a point query on an index rather than a scan.
+        """
+        organizations = self.master_db[ORGANIZATIONS_COLLECTION]
+        admins = self.master_db[ADMINS_COLLECTION]
+        await asyncio.gather(
+            organizations.create_index("organization_name", unique=True),
+            organizations.create_index("organization_id", unique=True),
+            admins.create_index("email", unique=True),
+            admins.create_index("admin_id", unique=True)
+        )
+        self.indexes_ready = True
+    
+    async def require_indexes(self):
+        """
+        Ensure the unique indexes exist before a master collection write.
+        
+        Startup tolerates an unreachable database, so the build is retried
+        here; if it still fails the error propagates and the write is refused
+        rather than risking duplicate organization names or admin emails.
+        """
+        if not self.indexes_ready:
+            await self.ensure_indexes()
+    
     def get_master_db(self):
         """Get the master database instance."""
         return self.master_db
@@ -61,9 +184,78 @@ class DatabaseManager:
         
         # Create a basic index for better performance
         await collection.create_index("created_at")
+        self._collection_exists_cache[collection_name] = True
         
         return collection
     
+    async def copy_organization_collection(self, source_name: str, target_name: str):
+        """
+        Copy every document of one organization collection into another.
+        
+        The copy runs server-side through an aggregation ``$out`` stage. If
+        the deployment rejects ``$out`` (e.g. a sharded target), documents
+        are streamed through the client in batches of ``COPY_BATCH_SIZE``;
+        if that copy fails, the partly filled target is dropped.
+        
+        Args:
+            source_name: Name of the collection to copy from
+            target_name: Name of the collection to copy into
+        """
+        source = self.master_db[source_name]
+        try:
+            await source.aggregate(
+                [{"$out": target_name}],
+                allowDiskUse=True
+            ).to_list(length=None)
+            return
+        except OperationFailure as error:
+            if error.code not in OUT_UNSUPPORTED_CODES:
+                raise
+        
+        target = self.master_db[target_name]
+        try:
+            await self._copy_through_client(source, target)
+        except BaseException:
+            # A partial copy would make every retry fail on duplicate _ids
+            await self.delete_organization_collection(target_name)
+            raise
+    
+    async def _copy_through_client(self, source, target):
+        """
+        Stream every document of ``source`` into ``target`` in batches.
+        
+        Each insert overlaps the ``getMore`` for the following batch.
+        
+        Args:
+            source: Collection to copy from
+            target: Collection to copy into
+        """
+        batch = []
+        pending = None
+        try:
+            async for document in source.find({}, batch_size=COPY_BATCH_SIZE):
+                batch.append(document)
+                if len(batch) >= COPY_BATCH_SIZE:
+                    # Insert this batch while the cursor fetches the next one
+                    if pending is not None:
+                        await pending
+                    pending = asyncio.ensure_future(target.insert_many(
+                        batch, ordered=False, bypass_document_validation=True
+                    ))
+                    batch = []
+        except BaseException:
+            # Motor runs the insert on a worker thread, so it cannot be
+            # cancelled; let it finish before the error propagates
+            if pending is not None:
+                await asyncio.gather(pending, return_exceptions=True)
+            raise
+        if pending is not None:
+            await pending
+        if batch:
+            await target.insert_many(
+                batch, ordered=False, bypass_document_validation=True
+            )
+    
     async def delete_organization_collection(self, collection_name: str):
         """
         Delete an organization's collection.
@@ -72,19 +264,30 @@ class DatabaseManager:
             collection_name: Name of the collection to delete
         """
         await self.master_db[collection_name].drop()
+        self._collection_exists_cache[collection_name] = False
     
     async def collection_exists(self, collection_name: str) -> bool:
         """
         Check if a collection exists.
         
+        The name filter is applied server-side and the answer is cached
+        briefly; collections created or dropped through this manager
+        update the cache immediately.
+        
         Args:
             collection_name: Name of the collection to check
             
         Returns:
             True if collection exists, False otherwise
         """
-        collections = await self.master_db.list_collection_names()
-        return collection_name in collections
+        exists = self._collection_exists_cache.get(collection_name)
+        if exists is None:
+            collections = await self.master_db.list_collection_names(
+                filter={"name": collection_name}
+            )
+            exists = bool(collections)
+            self._collection_exists_cache[collection_name] = exists
+        return exists
 
 
 # Global database manager instance
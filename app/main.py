@@ -2,24 +2,157 @@
 FastAPI application entry point.
 Configures and initializes the API server.
 """
-from fastapi import FastAPI
+import asyncio
+import hashlib
+import mimetypes
+from anyio import to_thread
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from starlette.exceptions import HTTPException
+from starlette.routing import Match, Mount
+from starlette.types import Scope
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Optional
 from app.config import settings
 from app.database import db_manager
 from app.routes import router
 
 
+frontend_path = Path(__file__).parent.parent / "frontend"
+
+# An asset requested with its current ?v=<hash> never changes under that URL,
+# so browsers may keep it for a year; everything else (unversioned or stale
+# URLs included) is revalidated through its ETag
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, max-age=60"
+
+
+def load_frontend_assets(directory: Path) -> dict:
+    """
+    Read every frontend file into memory once.
+    
+    Links to other frontend files inside index.html are rewritten to carry
+    a content hash (``/style.css?v=<hash>``), so a new deploy changes the
+    URL and bypasses the long-lived browser cache of those files.
+    
+    Args:
+        directory: Directory containing the frontend files
+        
+    Returns:
+        Mapping of path relative to the directory to
+        (content, media type, ETag, version), where version is the hash
+        index.html links the file with, or None
+    """
+    contents = {
+        asset_file.relative_to(directory).as_posix(): asset_file.read_bytes()
+        for asset_file in sorted(directory.rglob("*"))
+        if asset_file.is_file()
+    }
+    
+    versions = {}
+    index_html = contents.get("index.html")
+    if index_html is not None:
+        for name, content in contents.items():
+            link = f'"/{name}"'.encode()
+            if name != "index.html" and link in index_html:
+                version = hashlib.md5(content).hexdigest()[:12]
+                index_html = index_html.replace(link, f'"/{name}?v={version}"'.encode())
+                versions[name] = version
+        contents["index.html"] = index_html
+    
+    assets = {}
+    for name, content in contents.items():
+        media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        etag = f'"{hashlib.md5(content).hexdigest()}"'
+        assets[name] = (content, media_type, etag, versions.get(name))
+    return assets
+
+
+def asset_response(request: Request, name: str) -> Response:
+    """
+    Build a response for a preloaded frontend file.
+    
+    Answers with 304 Not Modified when the client already holds the
+    current version (If-None-Match), like Starlette's StaticFiles.
+    """
+    asset = request.app.state.frontend_assets.get(name)
+    if asset is None:
+        return Response(status_code=404)
+    
+    content, media_type, etag, version = asset
+    if version is not None and request.query_params.get("v") == version:
+        cache_control = IMMUTABLE_CACHE_CONTROL
+    else:
+        cache_control = REVALIDATE_CACHE_CONTROL
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip(" W/") for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
+class FrontendFiles(StaticFiles):
+    """
+    StaticFiles mount that answers from the preloaded assets only.
+    
+    Every request is a dict lookup; the disk is never touched. Unknown
+    extension-less paths fall back to index.html so client-side routes
+    still load the app.
+    """
+    
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+        
+        request = Request(scope)
+        name = "index.html" if path == "." else path
+        if name in request.app.state.frontend_assets:
+            return asset_response(request, name)
+        if not Path(path).suffix:
+            return asset_response(request, "index.html")
+        raise HTTPException(status_code=404)
+
+
+def first_path_segment(path: str) -> str:
+    """Return the first segment of a URL path ("/org/get" -> "org")."""
+    return path.lstrip("/").split("/", 1)[0]
+
+
+class FrontendMount(Mount):
+    """
+    Mount for the frontend that stays out of the way of API paths.
+    
+    Paths whose first segment belongs to one of the given routes are never
+    matched, so the router's own 404/405 responses reach the client.
+    """
+    
+    def __init__(self, path: str, app: StaticFiles, routes: list, name: Optional[str] = None):
+        super().__init__(path, app=app, name=name)
+        self.api_path_prefixes = frozenset(
+            segment
+            for segment in (first_path_segment(route.path) for route in routes)
+            if segment and "{" not in segment
+        )
+    
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        if first_path_segment(scope.get("path", "")) in self.api_path_prefixes:
+            return Match.NONE, {}
+        return super().matches(scope)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events.
     """
-    # Startup
-    await db_manager.connect_to_database()
+    # Startup: the tasks are independent, so run them concurrently
+    app.state.frontend_assets, _ = await asyncio.gather(
+        to_thread.run_sync(load_frontend_assets, frontend_path),
+        db_manager.connect_to_database()
+    )
     yield
     # Shutdown
     await db_manager.close_database_connection()
@@ -30,7 +163,8 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Multi-tenant organization management service with dynamic collection creation",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -45,65 +179,6 @@ app.add_middleware(
 # Include routers
 app.include_router(router, tags=["Organization Management"])
 
-# Mount static files for frontend
-frontend_path = Path(__file__).parent.parent / "frontend"
-if frontend_path.exists():
-    app.mount("/static", StaticFiles(directory=str(frontend_path), html=True), name="static")
-
-
-@app.get("/", tags=["Frontend"])
-async def serve_frontend():
-    """Serve the frontend application."""
-    frontend_file = frontend_path / "index.html"
-    if frontend_file.exists():
-        from fastapi.responses import HTMLResponse
-        with open(frontend_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return HTMLResponse(content=content, headers={
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0"
-        })
-    return {
-        "service": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "status": "running"
-    }
-
-
-# Serve CSS and JS files directly with no-cache headers
-@app.get("/style.css", tags=["Frontend"])
-async def serve_css():
-    """Serve CSS file with no-cache headers."""
-    css_file = frontend_path / "style.css"
-    if css_file.exists():
-        return FileResponse(
-            str(css_file),
-            media_type="text/css",
-            headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0"
-            }
-        )
-
-
-@app.get("/script.js", tags=["Frontend"])
-async def serve_js():
-    """Serve JavaScript file with no-cache headers."""
-    js_file = frontend_path / "script.js"
-    if js_file.exists():
-        return FileResponse(
-            str(js_file),
-            media_type="application/javascript",
-            headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0"
-            }
-        )
-
-
 @app.get("/api", tags=["Health"])
 async def root():
     """API root endpoint - health check."""
@@ -123,6 +198,25 @@ async def health_check():
     }
 
 
+# Mount the frontend last so API routes win route resolution
+if frontend_path.exists():
+    app.router.routes.append(FrontendMount(
+        "/",
+        app=FrontendFiles(directory=str(frontend_path), html=True),
+        routes=app.routes,
+        name="frontend"
+    ))
+else:
+    @app.get("/", tags=["Frontend"])
+    async def serve_frontend():
+        """Report service status when no frontend is bundled."""
+        return {
+            "service": settings.APP_NAME,
+            "version": settings.APP_VERSION,
+            "status": "running"
+        }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
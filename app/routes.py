@@ -2,30 +2,59 @@
 API routes for organization management.
 Defines all REST endpoints for the service.
 """
+from typing import Annotated
 from fastapi import APIRouter, Depends, status, Query
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi.responses import Response
+from pydantic import BaseModel
 from app.schemas import (
     OrganizationCreateRequest,
     OrganizationUpdateRequest,
     OrganizationResponse,
     OrganizationDeleteRequest,
+    OrganizationName,
     AdminLoginRequest,
     TokenResponse,
     MessageResponse
 )
 from app.services import OrganizationService
 from app.database import get_database_manager, DatabaseManager
-from app.security import get_security_manager, SecurityManager
+from app.security import get_security_manager, get_current_user, SecurityManager
 
 # Create router
 router = APIRouter()
 
 
-def get_organization_service(
+def model_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize a response model straight to JSON bytes.
+    
+    pydantic-core writes the body in one pass, skipping FastAPI's
+    jsonable_encoder round trip through plain dicts.
+    
+    Args:
+        model: Response model to send
+        status_code: HTTP status of the response
+        
+    Returns:
+        JSON response carrying the serialized model
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+async def get_organization_service(
     db_manager: DatabaseManager = Depends(get_database_manager),
     security_manager: SecurityManager = Depends(get_security_manager)
 ) -> OrganizationService:
-    """Dependency to get organization service instance."""
+    """
+    Dependency to get organization service instance.
+    
+    Declared async so the service is built on the event loop, which owns the
+    MongoDB client its collection handles come from.
+    """
     return OrganizationService(db_manager, security_manager)
 
 
@@ -39,7 +68,7 @@ def get_organization_service(
 async def create_organization(
     request: OrganizationCreateRequest,
     service: OrganizationService = Depends(get_organization_service)
-):
+) -> Response:
     """
     Create a new organization.
     
@@ -47,7 +76,10 @@ async def create_organization(
     - **email**: Admin email address
     - **password**: Admin password (min 8 characters)
     """
-    return await service.create_organization(request)
+    return model_response(
+        await service.create_organization(request),
+        status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get(
@@ -57,15 +89,15 @@ async def create_organization(
     description="Retrieve organization information by name"
 )
 async def get_organization(
-    organization_name: str = Query(..., description="Name of the organization"),
+    organization_name: Annotated[OrganizationName, Query(description="Name of the organization")],
     service: OrganizationService = Depends(get_organization_service)
-):
+) -> Response:
     """
     Get organization details by name.
     
     - **organization_name**: Name of the organization to retrieve
     """
-    return await service.get_organization(organization_name)
+    return model_response(await service.get_organization(organization_name))
 
 
 @router.put(
@@ -77,9 +109,8 @@ async def get_organization(
 async def update_organization(
     request: OrganizationUpdateRequest,
     service: OrganizationService = Depends(get_organization_service),
-    security_manager: SecurityManager = Depends(get_security_manager),
-    credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer())
-):
+    current_user: dict = Depends(get_current_user)
+) -> Response:
     """
     Update an organization (authentication required).
     
@@ -88,9 +119,9 @@ async def update_organization(
     
     Requires admin authentication via Bearer token.
     """
-    # Get current user from token
-    current_user = await security_manager.get_current_user(credentials)
-    return await service.update_organization(request, current_user)
+    return model_response(
+        await service.update_organization(request, current_user)
+    )
 
 
 @router.delete(
@@ -102,9 +133,8 @@ async def update_organization(
 async def delete_organization(
     request: OrganizationDeleteRequest,
     service: OrganizationService = Depends(get_organization_service),
-    security_manager: SecurityManager = Depends(get_security_manager),
-    credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer())
-):
+    current_user: dict = Depends(get_current_user)
+) -> Response:
     """
     Delete an organization (authentication required).
     
@@ -113,16 +143,14 @@ async def delete_organization(
     Requires admin authentication via Bearer token.
     Only the organization's admin can delete it.
     """
-    # Get current user from token
-    current_user = await security_manager.get_current_user(credentials)
     result = await service.delete_organization(
         request.organization_name, 
         current_user
     )
-    return MessageResponse(
+    return model_response(MessageResponse(
         message=result["message"],
         details={"organization_id": result["organization_id"]}
-    )
+    ))
 
 
 @router.post(
@@ -134,7 +162,7 @@ async def delete_organization(
 async def admin_login(
     request: AdminLoginRequest,
     service: OrganizationService = Depends(get_organization_service)
-):
+) -> Response:
     """
     Admin login endpoint.
     
@@ -143,4 +171,4 @@ async def admin_login(
     
     Returns a JWT token for authenticated requests.
     """
-    return await service.admin_login(request)
+    return model_response(await service.admin_login(request))
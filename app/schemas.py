@@ -1,40 +1,61 @@
 """
 Pydantic models for request/response validation.
 """
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional
+import re
+from pydantic import AfterValidator, BaseModel, ConfigDict, EmailStr, Field, field_validator
+from typing import Annotated, Optional
 from datetime import datetime
 
 
+# Organization names: ASCII letters, digits, hyphens and underscores
+ORGANIZATION_NAME_RE = re.compile(r"[A-Za-z0-9_-]+")
+_ORGANIZATION_NAME_TRANS = str.maketrans({"-": "_"})
+
+
+def normalize_organization_name(name: str) -> str:
+    """
+    Validate an organization name and return its canonical form.
+    
+    Args:
+        name: Organization name as submitted
+        
+    Returns:
+        Lowercase name with hyphens replaced by underscores
+        
+    Raises:
+        ValueError: If the name contains disallowed characters
+    """
+    if not ORGANIZATION_NAME_RE.fullmatch(name):
+        raise ValueError('Organization name must contain only alphanumeric characters, hyphens, and underscores')
+    return name.lower().translate(_ORGANIZATION_NAME_TRANS)
+
+
+# Shared by request bodies and query parameters, so every name reaching the
+# service layer is canonical and safe to embed in a collection name
+OrganizationName = Annotated[
+    str,
+    Field(min_length=3, max_length=50),
+    AfterValidator(normalize_organization_name)
+]
+
+
 class OrganizationCreateRequest(BaseModel):
     """Request model for creating an organization."""
-    organization_name: str = Field(..., min_length=3, max_length=50)
+    organization_name: OrganizationName
     email: EmailStr
     password: str = Field(..., min_length=8)
-    
-    @validator('organization_name')
-    def validate_organization_name(cls, v):
-        """Ensure organization name contains only alphanumeric and underscores."""
-        if not v.replace('_', '').replace('-', '').isalnum():
-            raise ValueError('Organization name must contain only alphanumeric characters, hyphens, and underscores')
-        return v.lower().replace(' ', '_').replace('-', '_')
 
 
 class OrganizationUpdateRequest(BaseModel):
     """Request model for updating an organization."""
-    organization_name: str = Field(..., min_length=3, max_length=50)
-    new_organization_name: str = Field(..., min_length=3, max_length=50)
-    
-    @validator('organization_name', 'new_organization_name')
-    def validate_organization_name(cls, v):
-        """Ensure organization name contains only alphanumeric and underscores."""
-        if not v.replace('_', '').replace('-', '').isalnum():
-            raise ValueError('Organization name must contain only alphanumeric characters, hyphens, and underscores')
-        return v.lower().replace(' ', '_').replace('-', '_')
+    organization_name: OrganizationName
+    new_organization_name: OrganizationName
 
 
 class OrganizationResponse(BaseModel):
     """Response model for organization details."""
+    model_config = ConfigDict(frozen=True)
+    
     organization_id: str
     organization_name: str
     collection_name: str
@@ -45,12 +66,27 @@ class OrganizationResponse(BaseModel):
 
 class AdminLoginRequest(BaseModel):
     """Request model for admin login."""
-    email: EmailStr
+    email: str
     password: str
+    
+    @field_validator('email')
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        """
+        Cheap shape check; addresses were fully validated at sign-up.
+        
+        The domain is lowercased to match how EmailStr stored it.
+        """
+        local, _, domain = v.strip().rpartition('@')
+        if not local or not domain:
+            raise ValueError('value is not a valid email address')
+        return f"{local}@{domain.lower()}"
 
 
 class TokenResponse(BaseModel):
     """Response model for authentication token."""
+    model_config = ConfigDict(frozen=True)
+    
     access_token: str
     token_type: str = "bearer"
     organization_name: str
@@ -59,10 +95,12 @@ class TokenResponse(BaseModel):
 
 class OrganizationDeleteRequest(BaseModel):
     """Request model for deleting an organization."""
-    organization_name: str
+    organization_name: OrganizationName
 
 
 class MessageResponse(BaseModel):
     """Generic message response."""
+    model_config = ConfigDict(frozen=True)
+    
     message: str
     details: Optional[dict] = None
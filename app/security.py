@@ -2,21 +2,53 @@
 Authentication and security utilities.
 Handles password hashing, JWT token generation and validation.
 """
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import timedelta
 from typing import Optional
-from jose import JWTError, jwt
+import jwt
+from cachetools import TTLCache
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.config import settings
 
 
+# Shared password hashing context (bcrypt cost is 2^BCRYPT_ROUNDS)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+
+# Shared bearer scheme, so every Depends() refers to the same callable
+bearer_scheme = HTTPBearer()
+
+# Decoded token payloads are reused for this long before re-verifying
+TOKEN_CACHE_MAXSIZE = 10000
+TOKEN_CACHE_TTL_SECONDS = 60
+
+
 class SecurityManager:
     """Manages security operations including password hashing and JWT tokens."""
     
     def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        self.security = HTTPBearer()
+        self.pwd_context = pwd_context
+        self.security = bearer_scheme
+        self._token_cache = TTLCache(
+            maxsize=TOKEN_CACHE_MAXSIZE,
+            ttl=TOKEN_CACHE_TTL_SECONDS
+        )
+        self._token_cache_lock = threading.Lock()
+        # Parse the keys once; PEM parsing would otherwise run on every
+        # RSA/EC sign and verify
+        algorithm = jwt.get_algorithm_by_name(settings.ALGORITHM)
+        self._signing_key = algorithm.prepare_key(settings.SECRET_KEY)
+        self._verify_key = algorithm.prepare_key(settings.JWT_VERIFY_KEY)
+        # HMAC signing takes microseconds; RSA/EC signing (private key in
+        # SECRET_KEY, public key in JWT_PUBLIC_KEY) is slow enough that
+        # callers should keep it off the event loop
+        self.signing_is_expensive = not settings.ALGORITHM.startswith("HS")
     
     def hash_password(self, password: str) -> str:
         """
@@ -58,19 +90,15 @@ class SecurityManager:
         Returns:
             Encoded JWT token
         """
-        to_encode = data.copy()
-        
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            lifetime = int(expires_delta.total_seconds())
         else:
-            expire = datetime.utcnow() + timedelta(
-                minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-            )
+            lifetime = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
         
-        to_encode.update({"exp": expire})
+        # "exp" is stored as integer epoch seconds, per the JWT spec
         encoded_jwt = jwt.encode(
-            to_encode, 
-            settings.SECRET_KEY, 
+            {**data, "exp": int(time.time()) + lifetime}, 
+            self._signing_key, 
             algorithm=settings.ALGORITHM
         )
         
@@ -80,6 +108,10 @@ class SecurityManager:
         """
         Decode and validate a JWT token.
         
+        Payloads of recently verified tokens are cached, so repeat
+        requests with the same token skip signature verification.
+        Expiry is still checked on every call.
+        
         Args:
             token: JWT token to decode
             
@@ -89,45 +121,26 @@ class SecurityManager:
         Raises:
             HTTPException: If token is invalid or expired
         """
+        with self._token_cache_lock:
+            payload = self._token_cache.get(token)
+        if payload is not None and payload.get("exp", 0) > time.time():
+            return payload
+        
         try:
             payload = jwt.decode(
                 token, 
-                settings.SECRET_KEY, 
+                self._verify_key, 
                 algorithms=[settings.ALGORITHM]
             )
-            return payload
-        except JWTError:
+        except jwt.PyJWTError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-    
-    async def get_current_user(
-        self, 
-        credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer())
-    ) -> dict:
-        """
-        Dependency to get current authenticated user from JWT token.
-        
-        Args:
-            credentials: HTTP Bearer credentials
-            
-        Returns:
-            User data from token
-            
-        Raises:
-            HTTPException: If authentication fails
-        """
-        token = credentials.credentials
-        payload = self.decode_token(token)
-        
-        if not payload:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials"
-            )
         
+        with self._token_cache_lock:
+            self._token_cache[token] = payload
         return payload
 
 
@@ -138,3 +151,31 @@ security_manager = SecurityManager()
 def get_security_manager() -> SecurityManager:
     """Dependency injection for security manager."""
     return security_manager
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    security_manager: SecurityManager = Depends(get_security_manager)
+) -> dict:
+    """
+    Dependency to get current authenticated user from JWT token.
+    
+    Args:
+        credentials: HTTP Bearer credentials
+        security_manager: Security manager used to decode the token
+        
+    Returns:
+        User data from token
+        
+    Raises:
+        HTTPException: If authentication fails
+    """
+    payload = security_manager.decode_token(credentials.credentials)
+    
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials"
+        )
+    
+    return payload
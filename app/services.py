@@ -2,11 +2,15 @@
 Business logic layer for organization management.
 Handles all organization-related operations with proper separation of concerns.
 """
-from datetime import datetime
-from typing import Optional
+import asyncio
+from datetime import datetime, timezone
+from typing import NoReturn, Optional
 from uuid import uuid4
+from cachetools import TTLCache
 from fastapi import HTTPException, status
-from app.database import DatabaseManager
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from app.database import DatabaseManager, ORGANIZATIONS_COLLECTION, ADMINS_COLLECTION
 from app.security import SecurityManager
 from app.models import OrganizationModel, AdminUserModel
 from app.schemas import (
@@ -18,6 +22,28 @@ from app.schemas import (
 )
 
 
+# Organization details served by get_organization, keyed by name. Entries are
+# dropped on rename/delete in this process; other workers may serve a stale
+# entry for at most the TTL.
+ORGANIZATION_CACHE_MAXSIZE = 1024
+ORGANIZATION_CACHE_TTL_SECONDS = 60
+_organization_cache = TTLCache(
+    maxsize=ORGANIZATION_CACHE_MAXSIZE,
+    ttl=ORGANIZATION_CACHE_TTL_SECONDS
+)
+# Bumped on every invalidation, so a lookup that was in flight when an
+# organization changed does not cache what it read before the change
+_organization_cache_generation = 0
+
+
+def _invalidate_cached_organizations(*organization_names: str):
+    """Drop cached organizations after a rename or delete."""
+    global _organization_cache_generation
+    _organization_cache_generation += 1
+    for organization_name in organization_names:
+        _organization_cache.pop(organization_name, None)
+
+
 class OrganizationService:
     """Service class for organization management operations."""
     
@@ -28,8 +54,47 @@ class OrganizationService:
     ):
         self.db = db_manager
         self.security = security_manager
-        self.organizations_collection = "organizations"
-        self.admins_collection = "admins"
+        self.organizations_collection = ORGANIZATIONS_COLLECTION
+        self.admins_collection = ADMINS_COLLECTION
+        
+        # Collection handles on the running loop's client; a service instance
+        # lives for a single request
+        master_db = db_manager.get_master_db()
+        self._orgs = master_db[self.organizations_collection]
+        self._admins = master_db[self.admins_collection]
+    
+    async def _find_organization_with_admin(self, query: dict) -> Optional[dict]:
+        """
+        Fetch one organization joined with its admin in a single round trip.
+        
+        Args:
+            query: Filter selecting the organization
+            
+        Returns:
+            Organization document with an ``admin`` list holding the matching
+            admin (empty if none), or None if no organization matches
+        """
+        organizations = await self._orgs.aggregate([
+            {"$match": query},
+            {"$limit": 1},
+            {"$lookup": {
+                "from": self.admins_collection,
+                "localField": "admin_id",
+                "foreignField": "admin_id",
+                "as": "admin"
+            }},
+            {"$project": {
+                "_id": 0,
+                "organization_id": 1,
+                "organization_name": 1,
+                "collection_name": 1,
+                "created_at": 1,
+                "updated_at": 1,
+                "admin.email": 1
+            }}
+        ]).to_list(length=1)
+        
+        return organizations[0] if organizations else None
     
     async def create_organization(
         self, 
@@ -45,39 +110,18 @@ class OrganizationService:
             Created organization details
             
         Raises:
-            HTTPException: If organization already exists
+            HTTPException: If organization or admin email already exists
         """
-        master_db = self.db.get_master_db()
-        
-        # Check if organization already exists
-        existing_org = await master_db[self.organizations_collection].find_one(
-            {"organization_name": request.organization_name}
-        )
-        
-        if existing_org:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Organization '{request.organization_name}' already exists"
-            )
-        
-        # Check if admin email already exists
-        existing_admin = await master_db[self.admins_collection].find_one(
-            {"email": request.email}
-        )
-        
-        if existing_admin:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Admin with email '{request.email}' already exists"
-            )
-        
         # Generate unique IDs
         organization_id = str(uuid4())
         admin_id = str(uuid4())
         collection_name = f"org_{request.organization_name}"
+        now = datetime.now(timezone.utc)
         
-        # Hash password
-        hashed_password = self.security.hash_password(request.password)
+        # Hash password; bcrypt is CPU-bound, so keep it off the event loop
+        hashed_password = await asyncio.to_thread(
+            self.security.hash_password, request.password
+        )
         
         # Create admin user document
         admin_data = AdminUserModel(
@@ -85,7 +129,7 @@ class OrganizationService:
             email=request.email,
             hashed_password=hashed_password,
             organization_id=organization_id,
-            created_at=datetime.utcnow(),
+            created_at=now,
             is_active=True
         )
         
@@ -95,28 +139,29 @@ class OrganizationService:
             organization_name=request.organization_name,
             collection_name=collection_name,
             admin_id=admin_id,
-            created_at=datetime.utcnow()
+            created_at=now
         )
         
         # Store in master database
-        await master_db[self.admins_collection].insert_one(
-            admin_data.dict()
-        )
-        await master_db[self.organizations_collection].insert_one(
-            organization_data.dict()
+        await self.db.require_indexes()
+        await self._store_organization_records(
+            organization_data.model_dump(),
+            admin_data.model_dump(),
+            request
         )
         
-        # Create dynamic collection for the organization
-        await self.db.create_organization_collection(collection_name)
-        
-        # Initialize the organization collection with metadata
+        # Create dynamic collection for the organization and initialize it
+        # with metadata; both implicitly create the same collection
         org_collection = self.db.get_organization_collection(collection_name)
-        await org_collection.insert_one({
-            "type": "metadata",
-            "organization_id": organization_id,
-            "created_at": datetime.utcnow(),
-            "description": f"Data collection for {request.organization_name}"
-        })
+        await asyncio.gather(
+            self.db.create_organization_collection(collection_name),
+            org_collection.insert_one({
+                "type": "metadata",
+                "organization_id": organization_id,
+                "created_at": now,
+                "description": f"Data collection for {request.organization_name}"
+            })
+        )
         
         return OrganizationResponse(
             organization_id=organization_id,
@@ -126,6 +171,109 @@ class OrganizationService:
             created_at=organization_data.created_at
         )
     
+    async def _store_organization_records(
+        self,
+        organization_doc: dict,
+        admin_doc: dict,
+        request: OrganizationCreateRequest
+    ):
+        """
+        Insert the organization and admin records as a unit.
+        
+        On replica sets and sharded clusters both inserts run in one
+        transaction. Standalone servers do not support transactions, so the
+        inserts run concurrently and a successful one is deleted again if
+        the other fails.
+        
+        Args:
+            organization_doc: Organization document to insert
+            admin_doc: Admin user document to insert
+            request: Organization creation request data
+            
+        Raises:
+            HTTPException: If organization or admin email already exists
+        """
+        if self.db.supports_transactions:
+            # Operations on one session cannot overlap, so run them in order.
+            # with_transaction retries transient errors (e.g. a write conflict
+            # with a concurrent create), so a lost race surfaces as the
+            # DuplicateKeyError of the retry; any other exception aborts
+            async def insert_records(session):
+                try:
+                    await self._orgs.insert_one(organization_doc, session=session)
+                except DuplicateKeyError as error:
+                    self._raise_duplicate(error, request, "organization_name")
+                try:
+                    await self._admins.insert_one(admin_doc, session=session)
+                except DuplicateKeyError as error:
+                    self._raise_duplicate(error, request, "email")
+            
+            async with await self.db.get_client().start_session() as session:
+                await session.with_transaction(insert_records)
+            return
+        
+        # The two inserts are independent, and unique indexes reject
+        # duplicate organization names and admin emails
+        org_result, admin_result = await asyncio.gather(
+            self._orgs.insert_one(organization_doc),
+            self._admins.insert_one(admin_doc),
+            return_exceptions=True
+        )
+        
+        org_failed = isinstance(org_result, BaseException)
+        admin_failed = isinstance(admin_result, BaseException)
+        if org_failed or admin_failed:
+            # Roll back whichever record was written
+            if not org_failed:
+                await self._orgs.delete_one(
+                    {"organization_id": organization_doc["organization_id"]}
+                )
+            if not admin_failed:
+                await self._admins.delete_one({"admin_id": admin_doc["admin_id"]})
+            
+            for result, default_key in (
+                (org_result, "organization_name"),
+                (admin_result, "email")
+            ):
+                if isinstance(result, DuplicateKeyError):
+                    self._raise_duplicate(result, request, default_key)
+            raise org_result if org_failed else admin_result
+    
+    def _raise_duplicate(
+        self,
+        error: DuplicateKeyError,
+        request: OrganizationCreateRequest,
+        default_key: str
+    ):
+        """
+        Translate a unique index violation on create into a 400 response.
+        
+        The violated index is read from the error's ``keyPattern``; servers
+        that omit it fall back to the natural key of the failed collection.
+        
+        Args:
+            error: Duplicate key error raised by the insert
+            request: Organization creation request data
+            default_key: Unique key to assume if the server did not report one
+            
+        Raises:
+            HTTPException: If the organization name or admin email is taken
+            DuplicateKeyError: If any other unique key collided
+        """
+        key_pattern = (error.details or {}).get("keyPattern") or {default_key: 1}
+        
+        if "organization_name" in key_pattern:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Organization '{request.organization_name}' already exists"
+            )
+        if "email" in key_pattern:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Admin with email '{request.email}' already exists"
+            )
+        raise error
+    
     async def get_organization(
         self, 
         organization_name: str
@@ -142,9 +290,13 @@ class OrganizationService:
         Raises:
             HTTPException: If organization not found
         """
-        master_db = self.db.get_master_db()
+        cached = _organization_cache.get(organization_name)
+        if cached is not None:
+            return cached
+        generation = _organization_cache_generation
         
-        organization = await master_db[self.organizations_collection].find_one(
+        # Get organization together with its admin details
+        organization = await self._find_organization_with_admin(
             {"organization_name": organization_name}
         )
         
@@ -154,19 +306,43 @@ class OrganizationService:
                 detail=f"Organization '{organization_name}' not found"
             )
         
-        # Get admin details
-        admin = await master_db[self.admins_collection].find_one(
-            {"admin_id": organization["admin_id"]}
-        )
+        admins = organization["admin"]
         
-        return OrganizationResponse(
+        response = OrganizationResponse(
             organization_id=organization["organization_id"],
             organization_name=organization["organization_name"],
             collection_name=organization["collection_name"],
-            admin_email=admin["email"] if admin else "N/A",
+            admin_email=admins[0]["email"] if admins else "N/A",
             created_at=organization["created_at"],
             updated_at=organization.get("updated_at")
         )
+        if generation == _organization_cache_generation:
+            _organization_cache[organization_name] = response
+        
+        return response
+    
+    async def _raise_missing_or_forbidden(self, organization_name: str, action: str) -> NoReturn:
+        """
+        Explain why an organization lookup scoped to the current user missed.
+        
+        Args:
+            organization_name: Name of the organization that was requested
+            action: Operation being attempted, used in the error message
+            
+        Raises:
+            HTTPException: 403 if the organization exists, 404 otherwise
+        """
+        if await self._orgs.count_documents(
+            {"organization_name": organization_name}, limit=1
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"You don't have permission to {action} this organization"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Organization '{organization_name}' not found"
+        )
     
     async def update_organization(
         self, 
@@ -186,79 +362,88 @@ class OrganizationService:
         Raises:
             HTTPException: If organization not found or update fails
         """
-        master_db = self.db.get_master_db()
-        
-        # Verify current organization exists
-        current_org = await master_db[self.organizations_collection].find_one(
-            {"organization_name": request.organization_name}
-        )
+        # Fetch the organization only if the user administers it, joined
+        # with its admin
+        current_org = await self._find_organization_with_admin({
+            "organization_name": request.organization_name,
+            "organization_id": current_user["organization_id"]
+        })
         
         if not current_org:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Organization '{request.organization_name}' not found"
+            await self._raise_missing_or_forbidden(
+                request.organization_name, "update"
             )
         
-        # Verify user is admin of this organization
-        if current_user["organization_id"] != current_org["organization_id"]:
+        old_collection_name = current_org["collection_name"]
+        new_collection_name = f"org_{request.new_organization_name}"
+        renamed = new_collection_name != old_collection_name
+        
+        # Ordering matters: the master record is repointed first, so the
+        # unique index on organization_name reserves the new name before
+        # anything is written under it; only then is the data copied ($out
+        # replaces whatever sits at the target), indexed, and the old
+        # collection dropped. A failed copy restores the old name.
+        await self.db.require_indexes()
+        try:
+            updated_org = await self._orgs.find_one_and_update(
+                {"organization_id": current_org["organization_id"]},
+                {
+                    "$set": {
+                        "organization_name": request.new_organization_name,
+                        "collection_name": new_collection_name,
+                        "updated_at": datetime.now(timezone.utc)
+                    }
+                },
+                projection={"_id": 0, "created_at": 1, "updated_at": 1},
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to update this organization"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Organization '{request.new_organization_name}' already exists"
             )
         
-        # Check if new name already exists
-        if request.organization_name != request.new_organization_name:
-            existing_org = await master_db[self.organizations_collection].find_one(
-                {"organization_name": request.new_organization_name}
+        if updated_org is None:
+            # Deleted concurrently since the lookup
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Organization '{request.organization_name}' not found"
             )
-            
-            if existing_org:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Organization '{request.new_organization_name}' already exists"
-                )
         
-        old_collection_name = current_org["collection_name"]
-        new_collection_name = f"org_{request.new_organization_name}"
-        
-        # Create new collection
-        await self.db.create_organization_collection(new_collection_name)
-        
-        # Migrate data from old collection to new collection
-        old_collection = self.db.get_organization_collection(old_collection_name)
-        new_collection = self.db.get_organization_collection(new_collection_name)
-        
-        # Copy all documents
-        async for document in old_collection.find():
-            await new_collection.insert_one(document)
-        
-        # Update organization record
-        await master_db[self.organizations_collection].update_one(
-            {"organization_id": current_org["organization_id"]},
-            {
-                "$set": {
-                    "organization_name": request.new_organization_name,
-                    "collection_name": new_collection_name,
-                    "updated_at": datetime.utcnow()
-                }
-            }
+        _invalidate_cached_organizations(
+            request.organization_name, request.new_organization_name
         )
         
-        # Delete old collection
-        await self.db.delete_organization_collection(old_collection_name)
+        if renamed:
+            try:
+                await self.db.copy_organization_collection(
+                    old_collection_name, new_collection_name
+                )
+                await self.db.create_organization_collection(new_collection_name)
+            except BaseException:
+                await self._orgs.update_one(
+                    {"organization_id": current_org["organization_id"]},
+                    {
+                        "$set": {
+                            "organization_name": request.organization_name,
+                            "collection_name": old_collection_name
+                        }
+                    }
+                )
+                _invalidate_cached_organizations(request.new_organization_name)
+                raise
+            
+            await self.db.delete_organization_collection(old_collection_name)
         
-        # Get admin details
-        admin = await master_db[self.admins_collection].find_one(
-            {"admin_id": current_org["admin_id"]}
-        )
+        admins = current_org["admin"]
         
         return OrganizationResponse(
             organization_id=current_org["organization_id"],
             organization_name=request.new_organization_name,
             collection_name=new_collection_name,
-            admin_email=admin["email"] if admin else "N/A",
-            created_at=current_org["created_at"],
-            updated_at=datetime.utcnow()
+            admin_email=admins[0]["email"] if admins else "N/A",
+            created_at=updated_org["created_at"],
+            updated_at=updated_org["updated_at"]
         )
     
     async def delete_organization(
@@ -279,40 +464,37 @@ class OrganizationService:
         Raises:
             HTTPException: If organization not found or user unauthorized
         """
-        master_db = self.db.get_master_db()
-        
-        # Find organization
-        organization = await master_db[self.organizations_collection].find_one(
-            {"organization_name": organization_name}
+        # Find organization, provided the user administers it
+        organization = await self._orgs.find_one(
+            {
+                "organization_name": organization_name,
+                "organization_id": current_user["organization_id"]
+            },
+            projection={
+                "_id": 0,
+                "organization_id": 1,
+                "collection_name": 1,
+                "admin_id": 1
+            }
         )
         
         if not organization:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Organization '{organization_name}' not found"
-            )
-        
-        # Verify user is admin of this organization
-        if current_user["organization_id"] != organization["organization_id"]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to delete this organization"
+            await self._raise_missing_or_forbidden(organization_name, "delete")
+        
+        # Delete organization collection, admin user and organization record;
+        # the three are independent once the IDs are known
+        await asyncio.gather(
+            self.db.delete_organization_collection(
+                organization["collection_name"]
+            ),
+            self._admins.delete_one(
+                {"admin_id": organization["admin_id"]}
+            ),
+            self._orgs.delete_one(
+                {"organization_id": organization["organization_id"]}
             )
-        
-        # Delete organization collection
-        await self.db.delete_organization_collection(
-            organization["collection_name"]
-        )
-        
-        # Delete admin user
-        await master_db[self.admins_collection].delete_one(
-            {"admin_id": organization["admin_id"]}
-        )
-        
-        # Delete organization record
-        await master_db[self.organizations_collection].delete_one(
-            {"organization_id": organization["organization_id"]}
         )
+        _invalidate_cached_organizations(organization_name)
         
         return {
             "message": f"Organization '{organization_name}' successfully deleted",
@@ -335,12 +517,27 @@ class OrganizationService:
         Raises:
             HTTPException: If authentication fails
         """
-        master_db = self.db.get_master_db()
-        
-        # Find admin by email
-        admin = await master_db[self.admins_collection].find_one(
-            {"email": request.email}
-        )
+        # Find admin by email, joined with its organization
+        admins = await self._admins.aggregate([
+            {"$match": {"email": request.email}},
+            {"$limit": 1},
+            {"$lookup": {
+                "from": self.organizations_collection,
+                "localField": "organization_id",
+                "foreignField": "organization_id",
+                "as": "organization"
+            }},
+            {"$project": {
+                "_id": 0,
+                "admin_id": 1,
+                "email": 1,
+                "hashed_password": 1,
+                "organization_id": 1,
+                "is_active": 1,
+                "organization.organization_name": 1
+            }}
+        ]).to_list(length=1)
+        admin = admins[0] if admins else None
         
         if not admin:
             raise HTTPException(
@@ -348,8 +545,9 @@ class OrganizationService:
                 detail="Invalid email or password"
             )
         
-        # Verify password
-        if not self.security.verify_password(
+        # Verify password off the event loop
+        if not await asyncio.to_thread(
+            self.security.verify_password,
             request.password, 
             admin["hashed_password"]
         ):
@@ -366,9 +564,7 @@ class OrganizationService:
             )
         
         # Get organization details
-        organization = await master_db[self.organizations_collection].find_one(
-            {"organization_id": admin["organization_id"]}
-        )
+        organization = admin["organization"][0] if admin["organization"] else None
         
         if not organization:
             raise HTTPException(
@@ -384,7 +580,12 @@ class OrganizationService:
             "organization_name": organization["organization_name"]
         }
         
-        access_token = self.security.create_access_token(data=token_data)
+        if self.security.signing_is_expensive:
+            access_token = await asyncio.to_thread(
+                self.security.create_access_token, token_data
+            )
+        else:
+            access_token = self.security.create_access_token(data=token_data)
         
         return TokenResponse(
             access_token=access_token,
@@ -0,0 +1,72 @@
+"""
+Routing between the API and the frontend mount.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from starlette.routing import Match, Route
+from app.main import (
+    FrontendFiles,
+    FrontendMount,
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    app,
+    frontend_path,
+    load_frontend_assets
+)
+
+
+@pytest.fixture
+def client():
+    # Load the assets directly instead of running the lifespan, which
+    # would try to reach MongoDB
+    app.state.frontend_assets = load_frontend_assets(frontend_path)
+    return TestClient(app)
+
+
+def test_wrong_method_on_api_route_returns_405(client):
+    response = client.get("/org/create")
+    
+    assert response.status_code == 405
+    assert response.headers["allow"] == "POST"
+
+
+def test_unknown_api_path_returns_json_404(client):
+    for path in ("/org/nonexistent", "/api/x"):
+        response = client.get(path)
+        
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Not Found"}
+
+
+def test_frontend_mount_declines_every_registered_api_prefix():
+    routes = [Route("/widgets/{widget_id}", endpoint=lambda request: None)]
+    mount = FrontendMount(
+        "/",
+        app=FrontendFiles(directory=str(frontend_path)),
+        routes=routes
+    )
+    
+    declined, _ = mount.matches({"type": "http", "path": "/widgets/7", "root_path": ""})
+    matched, _ = mount.matches({"type": "http", "path": "/dashboard", "root_path": ""})
+    
+    assert declined == Match.NONE
+    assert matched == Match.FULL
+
+
+def test_client_side_route_falls_back_to_index(client):
+    response = client.get("/dashboard")
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+
+
+def test_only_current_asset_version_is_cached_immutably(client):
+    version = app.state.frontend_assets["style.css"][3]
+    
+    current = client.get(f"/style.css?v={version}")
+    unversioned = client.get("/style.css")
+    stale = client.get("/style.css?v=0123456789ab")
+    
+    assert current.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert unversioned.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    assert stale.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
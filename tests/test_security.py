@@ -0,0 +1,30 @@
+"""
+Token decoding and its payload cache.
+"""
+import time
+import pytest
+from fastapi import HTTPException
+from app import security
+from app.security import SecurityManager
+
+
+def test_cached_token_skips_signature_verification(monkeypatch):
+    manager = SecurityManager()
+    token = manager.create_access_token({"admin_id": "admin-1"})
+    manager.decode_token(token)
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("token was decoded again")
+    monkeypatch.setattr(security.jwt, "decode", fail)
+    
+    assert manager.decode_token(token)["admin_id"] == "admin-1"
+
+
+def test_expired_cached_payload_is_not_served():
+    manager = SecurityManager()
+    manager._token_cache["not-a-jwt"] = {"admin_id": "admin-1", "exp": time.time() - 1}
+    
+    with pytest.raises(HTTPException) as raised:
+        manager.decode_token("not-a-jwt")
+    
+    assert raised.value.status_code == 401
@@ -0,0 +1,211 @@
+"""
+Uniqueness handling and rename ordering in OrganizationService.
+
+MongoDB is replaced by small in-memory fakes, so only the service logic
+runs.
+"""
+import asyncio
+from datetime import datetime, timezone
+import pytest
+from fastapi import HTTPException
+from pymongo.errors import DuplicateKeyError
+from app.database import ORGANIZATIONS_COLLECTION, ADMINS_COLLECTION
+from app.schemas import OrganizationCreateRequest, OrganizationUpdateRequest
+from app.services import OrganizationService
+
+
+class FakeCollection:
+    """Collection stub that records calls and raises configured errors."""
+    
+    def __init__(self, **errors):
+        self.errors = errors
+        self.calls = []
+    
+    async def _call(self, method, *args, result=None):
+        self.calls.append((method, *args))
+        if method in self.errors:
+            raise self.errors[method]
+        return result
+    
+    async def insert_one(self, document, session=None):
+        return await self._call("insert_one", document)
+    
+    async def delete_one(self, query):
+        return await self._call("delete_one", query)
+    
+    async def update_one(self, query, update):
+        return await self._call("update_one", query, update)
+    
+    async def find_one_and_update(self, query, update, **kwargs):
+        now = datetime.now(timezone.utc)
+        return await self._call(
+            "find_one_and_update", query, update,
+            result={"created_at": now, "updated_at": now}
+        )
+    
+    def methods(self):
+        return [call[0] for call in self.calls]
+
+
+class FakeDatabaseManager:
+    """DatabaseManager stub for a standalone server."""
+    
+    supports_transactions = False
+    
+    def __init__(self, organizations, admins, copy_error=None):
+        self.collections = {
+            ORGANIZATIONS_COLLECTION: organizations,
+            ADMINS_COLLECTION: admins
+        }
+        self.copy_error = copy_error
+        self.calls = []
+    
+    def get_master_db(self):
+        return self.collections
+    
+    async def require_indexes(self):
+        pass
+    
+    async def copy_organization_collection(self, source_name, target_name):
+        self.calls.append(("copy", source_name, target_name))
+        if self.copy_error is not None:
+            raise self.copy_error
+    
+    async def create_organization_collection(self, collection_name):
+        self.calls.append(("create", collection_name))
+    
+    async def delete_organization_collection(self, collection_name):
+        self.calls.append(("delete", collection_name))
+
+
+def duplicate_key_error(key_pattern=None):
+    details = {"keyPattern": key_pattern} if key_pattern else {}
+    return DuplicateKeyError("E11000 duplicate key error", 11000, details)
+
+
+def make_service(organizations=None, admins=None, copy_error=None):
+    db = FakeDatabaseManager(
+        organizations or FakeCollection(),
+        admins or FakeCollection(),
+        copy_error=copy_error
+    )
+    return OrganizationService(db, security_manager=None), db
+
+
+CREATE_REQUEST = OrganizationCreateRequest(
+    organization_name="acme",
+    email="admin@acme.com",
+    password="password123"
+)
+
+
+@pytest.mark.parametrize("key_pattern, default_key, detail", [
+    ({"organization_name": 1}, "email", "Organization 'acme' already exists"),
+    ({"email": 1}, "organization_name", "Admin with email 'admin@acme.com' already exists"),
+    (None, "organization_name", "Organization 'acme' already exists"),
+    (None, "email", "Admin with email 'admin@acme.com' already exists"),
+])
+def test_raise_duplicate_maps_key_pattern(key_pattern, default_key, detail):
+    service, _ = make_service()
+    
+    with pytest.raises(HTTPException) as raised:
+        service._raise_duplicate(duplicate_key_error(key_pattern), CREATE_REQUEST, default_key)
+    
+    assert raised.value.status_code == 400
+    assert raised.value.detail == detail
+
+
+def test_raise_duplicate_reraises_other_keys():
+    service, _ = make_service()
+    error = duplicate_key_error({"admin_id": 1})
+    
+    with pytest.raises(DuplicateKeyError):
+        service._raise_duplicate(error, CREATE_REQUEST, "email")
+
+
+def test_store_records_rolls_back_organization_when_admin_insert_fails():
+    organizations = FakeCollection()
+    admins = FakeCollection(insert_one=duplicate_key_error({"email": 1}))
+    service, _ = make_service(organizations, admins)
+    
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(service._store_organization_records(
+            {"organization_id": "org-1"}, {"admin_id": "admin-1"}, CREATE_REQUEST
+        ))
+    
+    assert raised.value.detail == "Admin with email 'admin@acme.com' already exists"
+    assert ("delete_one", {"organization_id": "org-1"}) in organizations.calls
+    assert "delete_one" not in admins.methods()
+
+
+def test_store_records_rolls_back_admin_when_organization_insert_fails():
+    organizations = FakeCollection(insert_one=duplicate_key_error({"organization_name": 1}))
+    admins = FakeCollection()
+    service, _ = make_service(organizations, admins)
+    
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(service._store_organization_records(
+            {"organization_id": "org-1"}, {"admin_id": "admin-1"}, CREATE_REQUEST
+        ))
+    
+    assert raised.value.detail == "Organization 'acme' already exists"
+    assert ("delete_one", {"admin_id": "admin-1"}) in admins.calls
+    assert "delete_one" not in organizations.methods()
+
+
+def rename(service, new_name="xray"):
+    async def find_current(query):
+        return {
+            "organization_id": "org-1",
+            "organization_name": "acme",
+            "collection_name": "org_acme",
+            "admin": [{"email": "admin@acme.com"}]
+        }
+    service._find_organization_with_admin = find_current
+    request = OrganizationUpdateRequest(
+        organization_name="acme",
+        new_organization_name=new_name
+    )
+    return asyncio.run(service.update_organization(request, {"organization_id": "org-1"}))
+
+
+def test_rename_to_taken_name_touches_no_collection():
+    organizations = FakeCollection(find_one_and_update=duplicate_key_error({"organization_name": 1}))
+    service, db = make_service(organizations)
+    
+    with pytest.raises(HTTPException) as raised:
+        rename(service)
+    
+    assert raised.value.status_code == 400
+    assert raised.value.detail == "Organization 'xray' already exists"
+    assert db.calls == []
+
+
+def test_rename_reserves_name_before_copying():
+    organizations = FakeCollection()
+    service, db = make_service(organizations)
+    
+    response = rename(service)
+    
+    assert organizations.methods() == ["find_one_and_update"]
+    assert db.calls == [
+        ("copy", "org_acme", "org_xray"),
+        ("create", "org_xray"),
+        ("delete", "org_acme")
+    ]
+    assert response.collection_name == "org_xray"
+
+
+def test_failed_copy_restores_old_name():
+    organizations = FakeCollection()
+    service, db = make_service(organizations, copy_error=RuntimeError("copy failed"))
+    
+    with pytest.raises(RuntimeError):
+        rename(service)
+    
+    assert organizations.calls[-1] == (
+        "update_one",
+        {"organization_id": "org-1"},
+        {"$set": {"organization_name": "acme", "collection_name": "org_acme"}}
+    )
+    assert ("delete", "org_acme") not in db.calls